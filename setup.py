@@ -15,6 +15,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/CPScript/WebDOM",
     packages=find_packages(),
+    package_data={"webdom_extractor": ["parser_daemon.js"]},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -22,28 +23,33 @@ setup(
         "Intended Audience :: Science/Research",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
         "Topic :: Internet :: WWW/HTTP",
         "Topic :: Text Processing :: Markup :: HTML",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.10",
     install_requires=[
         "html2text>=2020.1.16",
         "requests>=2.25.0",
         "aiohttp>=3.7.4",
         "beautifulsoup4>=4.9.3",
         "lxml>=4.6.3",
-        "pydantic>=1.8.2",
+        "pydantic>=2.0",
         "click>=8.0.1",
         "rich>=10.9.0",
         "diskcache>=5.2.1",
         "bleach>=4.1.0",
-        "validators>=0.18.2",
     ],
+    extras_require={
+        "speed": [
+            'uvloop>=0.16.0; sys_platform != "win32"',
+            "xxhash>=3.0.0",
+            "zstandard>=0.17.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "webdom=webdom_extractor.cli:cli",
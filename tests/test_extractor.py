@@ -61,23 +61,56 @@ class TestExtractor:
                     extractor.extract_url("not-a-url")
 
     def test_run_parser(self):
-        """Test running the parser."""
+        """Test falling back to the Postlight Parser subprocess."""
         with patch("webdom_extractor.extractor.Extractor._find_parser_path") as mock_find:
             mock_find.return_value = "/path/to/parser"
             with patch("os.path.exists") as mock_exists:
                 mock_exists.return_value = True
-                
-                extractor = Extractor()
-                
-                # Mock subprocess.run
-                with patch("subprocess.run") as mock_run:
-                    mock_result = MagicMock()
-                    mock_result.stdout = '{"title":"Test","content":"<p>Test</p>"}'
-                    mock_run.return_value = mock_result
-                    
+
+                extractor = Extractor(config={"cache": {"enabled": False}})
+
+                # Make in-process extraction fail so the subprocess runs
+                with patch(
+                    "webdom_extractor.extractor.Extractor._fetch_html"
+                ) as mock_fetch:
+                    mock_fetch.side_effect = FetchError("Fetch failed")
+
+                    # Mock the one-shot parser spawn
+                    with patch(
+                        "webdom_extractor.extractor.Extractor._spawn_parser"
+                    ) as mock_spawn:
+                        mock_spawn.return_value = (
+                            b'{"title":"Test","content":"<p>Test</p>"}'
+                        )
+
+                        result = extractor._run_parser("https://example.com")
+                        assert result["title"] == "Test"
+                        assert result["content"] == "<p>Test</p>"
+
+    def test_run_parser_in_process(self):
+        """Test the in-process lxml extraction path."""
+        with patch("webdom_extractor.extractor.Extractor._find_parser_path") as mock_find:
+            mock_find.return_value = "/path/to/parser"
+            with patch("os.path.exists") as mock_exists:
+                mock_exists.return_value = True
+
+                extractor = Extractor(config={"cache": {"enabled": False}})
+
+                body = "Test content. " * 50
+                html = (
+                    "<html><head><title>Test Title</title></head>"
+                    f"<body><article><p>{body}</p></article></body></html>"
+                )
+
+                with patch(
+                    "webdom_extractor.extractor.Extractor._fetch_html"
+                ) as mock_fetch:
+                    mock_fetch.return_value = html
+
                     result = extractor._run_parser("https://example.com")
-                    assert result["title"] == "Test"
-                    assert result["content"] == "<p>Test</p>"
+                    assert result["title"] == "Test Title"
+                    assert "Test content." in result["content"]
+                    assert result["word_count"] == 100
 
     def test_extract_html(self):
         """Test extracting content from HTML."""
@@ -116,13 +149,12 @@ class TestExtractor:
                     mock_extract.return_value = document
                     
                     urls = ["https://example.com", "https://example.org"]
-                    results = extractor.extract_batch(urls)
-                    
+                    results = dict(extractor.extract_batch(urls))
+
+                    # Completion order isn't guaranteed, pairing is
                     assert len(results) == 2
-                    assert results[0][0] == "https://example.com"
-                    assert results[0][1] == document
-                    assert results[1][0] == "https://example.org"
-                    assert results[1][1] == document
+                    assert results["https://example.com"] == document
+                    assert results["https://example.org"] == document
 
     def test_fallback_extraction(self):
         """Test fallback extraction."""
@@ -133,21 +165,19 @@ class TestExtractor:
                 
                 extractor = Extractor()
                 
-                # Mock requests.get
-                with patch("requests.get") as mock_get:
+                # Mock the shared session
+                with patch("webdom_extractor.extractor._SESSION.get") as mock_get:
                     mock_response = MagicMock()
-                    mock_response.text = "<html><body><p>Test</p></body></html>"
+                    mock_response.text = (
+                        "<html><head><title>Test</title></head>"
+                        "<body><article><p>Test</p></article></body></html>"
+                    )
                     mock_get.return_value = mock_response
-                    
-                    # Mock BeautifulSoup
-                    with patch("webdom_extractor.extractor.BeautifulSoup") as mock_soup:
-                        soup = MagicMock()
-                        soup.find.return_value = MagicMock()
-                        soup.find.return_value.text = "Test"
-                        mock_soup.return_value = soup
-                        
-                        document = extractor._fallback_extraction("https://example.com")
-                        assert isinstance(document, Document)
+
+                    document = extractor._fallback_extraction("https://example.com")
+                    assert isinstance(document, Document)
+                    assert document.metadata.title == "Test"
+                    assert "<p>Test</p>" in document.content.html
 
     def test_cache(self):
         """Test content caching."""
@@ -176,15 +206,12 @@ class TestExtractor:
                         }
                         
                         # First call should run parser
-                        with patch("validators.url") as mock_validator:
-                            mock_validator.return_value = True
-                            
-                            document1 = extractor.extract_url("https://example.com")
-                            assert document1.metadata.title == "Test"
-                            
-                            # Second call should use cache
-                            document2 = extractor.extract_url("https://example.com")
-                            assert document2.metadata.title == "Test"
-                            
-                            # Parser should be called only once
-                            assert mock_run_parser.call_count == 1
+                        document1 = extractor.extract_url("https://example.com")
+                        assert document1.metadata.title == "Test"
+
+                        # Second call should use cache
+                        document2 = extractor.extract_url("https://example.com")
+                        assert document2.metadata.title == "Test"
+
+                        # Parser should be called only once
+                        assert mock_run_parser.call_count == 1
@@ -1,9 +1,12 @@
+import importlib
 import logging
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-from webdom_extractor.extractor import Extractor, ExtractionConfig
-from webdom_extractor.document import Document
-from webdom_extractor.formatters import OutputFormat
+if TYPE_CHECKING:
+    from webdom_extractor.config import ExtractionConfig
+    from webdom_extractor.document import Document
+    from webdom_extractor.extractor import Extractor
+    from webdom_extractor.formatters import OutputFormat
 
 __version__ = "1.0.0"
 __author__ = "CPScript"
@@ -12,8 +15,27 @@ __license__ = "MIT"
 # Configure logging
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
+# Public attributes resolved lazily (PEP 562) so importing the package
+# doesn't pull in aiohttp/lxml/pydantic until they're actually needed
+_LAZY_ATTRS = {
+    "Extractor": "webdom_extractor.extractor",
+    "ExtractionConfig": "webdom_extractor.config",
+    "Document": "webdom_extractor.document",
+    "OutputFormat": "webdom_extractor.formatters",
+}
 
-def extract_url(url: str, config: Optional[Dict] = None) -> Document:
+
+def __getattr__(name: str):
+    """Resolve public attributes on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(module_name), name)
+    globals()[name] = attr
+    return attr
+
+
+def extract_url(url: str, config: Optional[Dict] = None) -> "Document":
     """Extract content from a URL.
 
     A convenience function that creates an Extractor instance and extracts
@@ -30,11 +52,13 @@ def extract_url(url: str, config: Optional[Dict] = None) -> Document:
         >>> doc = extract_url("https://example.com/article")
         >>> print(doc.to_markdown())
     """
+    from webdom_extractor.extractor import Extractor
+
     extractor = Extractor(config=config)
     return extractor.extract_url(url)
 
 
-def extract_html(html: str, url: Optional[str] = None, config: Optional[Dict] = None) -> Document:
+def extract_html(html: str, url: Optional[str] = None, config: Optional[Dict] = None) -> "Document":
     """Extract content from HTML.
 
     A convenience function that creates an Extractor instance and extracts
@@ -54,6 +78,8 @@ def extract_html(html: str, url: Optional[str] = None, config: Optional[Dict] =
         >>> doc = extract_html(html, url="https://example.com/article")
         >>> print(doc.to_text())
     """
+    from webdom_extractor.extractor import Extractor
+
     extractor = Extractor(config=config)
     return extractor.extract_html(html, url=url)
 
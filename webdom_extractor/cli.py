@@ -7,25 +7,92 @@ for extracting clean, readable content from web pages.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TextIO, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TextIO, Tuple
+from urllib.parse import urlparse
 
 import click
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
-from webdom_extractor import Extractor, Document
-from webdom_extractor.config import Config
-from webdom_extractor.formatters import OutputFormat
+if TYPE_CHECKING:
+    from webdom_extractor import Document, Extractor
 
 # Initialize rich console for prettier output
 console = Console()
 
+# Filename-sanitizing patterns, compiled once at import
+_EXT_RE = re.compile(r"\.[^.]+$")
+_SAFE_RE = re.compile(r"[^\w\-]")
+
+# Directories already created this run, so batch saves skip the
+# per-URL mkdir/stat syscalls
+_CREATED_DIRS: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process, memoized.
+
+    Args:
+        path: Directory to create
+    """
+    if path not in _CREATED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
+
+# Above this size, process-html streams the file instead of slurping it
+_LARGE_HTML_THRESHOLD = 1 << 20  # 1MB
+
+
+def _stream_extract_content(html_file: str) -> Optional[str]:
+    """Stream-parse a large HTML file and return only its content regions.
+
+    Uses lxml's incremental iterparse so peak memory stays bounded by the
+    content subtrees rather than the whole document: each matched element
+    is serialized, then cleared along with its already-processed siblings.
+
+    Args:
+        html_file: Path to the HTML file
+
+    Returns:
+        Optional[str]: Serialized content HTML, or None if no semantic
+            content container was found
+    """
+    from lxml import etree
+
+    content_parts = []
+    with open(html_file, "rb") as f:
+        context = etree.iterparse(
+            f, events=("end",), html=True, tag=("article", "main")
+        )
+        for _, elem in context:
+            content_parts.append(
+                etree.tostring(elem, encoding="unicode", method="html")
+            )
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    if content_parts:
+        return "\n".join(content_parts)
+    return None
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Set up logging with rich formatter.
@@ -52,9 +119,59 @@ def setup_logging(verbose: bool = False) -> None:
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=None)
+def _load_config_file(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Read and parse a configuration file, memoized by path and mtime.
+
+    Args:
+        config_path: Path to configuration file
+        mtime: File modification time, part of the cache key so edits
+            invalidate the cached parse
+
+    Returns:
+        Dict: Configuration dictionary
+    """
+    with open(config_path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _document_to_json(document: "Document") -> str:
+    """Serialize a document to pretty-printed JSON.
+
+    Prefers orjson's C encoder when available, which also serializes
+    datetime values natively.
+
+    Args:
+        document: Document to serialize
+
+    Returns:
+        str: JSON string representation
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            document.to_dict(), option=orjson.OPT_INDENT_2
+        ).decode("utf-8")
+    return document.to_json(pretty=True)
+
+
+# Output-format dispatch shared by the extract and process-html commands
+_FORMATTERS = {
+    "json": _document_to_json,
+    "markdown": lambda document: document.to_markdown(),
+    "text": lambda document: document.to_text(),
+    "html": lambda document: document.content.html,
+}
+
+
 def load_config(config_path: Optional[str]) -> Dict[str, Any]:
     """Load configuration from file.
 
+    Repeated loads of an unchanged file are served from an in-process
+    cache instead of re-reading and re-parsing JSON.
+
     Args:
         config_path: Path to configuration file
 
@@ -63,11 +180,11 @@ def load_config(config_path: Optional[str]) -> Dict[str, Any]:
     """
     if not config_path:
         return {}
-        
+
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError) as e:
+        mtime = os.path.getmtime(config_path)
+        return _load_config_file(config_path, mtime)
+    except (ValueError, FileNotFoundError, OSError) as e:
         console.print(f"[bold red]Error loading configuration:[/] {e}")
         sys.exit(1)
 
@@ -148,6 +265,8 @@ def extract(
         config_dict["formatting"] = {}
     config_dict["formatting"]["line_width"] = width
     
+    from webdom_extractor import Extractor
+
     with console.status("[bold green]Extracting content...", spinner="dots"):
         try:
             extractor = Extractor(config=config_dict, parser_path=parser_path)
@@ -158,16 +277,7 @@ def extract(
     
     # Get content in requested format
     try:
-        if format == "json":
-            content = document.to_json(pretty=True)
-        elif format == "markdown":
-            content = document.to_markdown()
-        elif format == "text":
-            content = document.to_text()
-        elif format == "html":
-            content = document.content.html
-        else:
-            content = document.to_markdown()
+        content = _FORMATTERS.get(format, _FORMATTERS["markdown"])(document)
     except Exception as e:
         console.print(f"[bold red]Error formatting output:[/] {e}")
         sys.exit(1)
@@ -177,8 +287,10 @@ def extract(
         try:
             path = Path(output)
             path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Binary mode with a large buffer skips the TextIOWrapper
+            # incremental-encode loop: one encode, one buffered write
+            with open(path, "wb", buffering=1 << 20) as f:
+                f.write(content.encode("utf-8"))
             console.print(f"[bold green]Content saved to {output}")
         except Exception as e:
             console.print(f"[bold red]Error writing to file:[/] {e}")
@@ -224,10 +336,10 @@ def extract(
     help="Number of parallel workers"
 )
 @click.option(
-    "--async",
+    "--async/--sync",
     "use_async",
-    is_flag=True,
-    help="Use asynchronous extraction"
+    default=True,
+    help="Use asynchronous extraction (default) or the thread pool"
 )
 @click.pass_context
 def batch(
@@ -268,12 +380,14 @@ def batch(
     # Create output directory
     output_path = Path(output_dir)
     try:
-        output_path.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_path)
     except Exception as e:
         console.print(f"[bold red]Error creating output directory:[/] {e}")
         sys.exit(1)
     
     # Initialize extractor
+    from webdom_extractor import Extractor
+
     try:
         extractor = Extractor(config=config_dict, parser_path=parser_path)
     except Exception as e:
@@ -282,6 +396,14 @@ def batch(
         
     # Process URLs
     if use_async:
+        # libuv-backed event loop is a drop-in throughput win when present
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
+
         results = asyncio.run(
             _process_urls_async(extractor, urls, workers, format, output_path)
         )
@@ -301,12 +423,12 @@ def batch(
 
 
 def _process_urls(
-    extractor: Extractor,
+    extractor: "Extractor",
     urls: List[str],
     workers: int,
     format: str,
     output_path: Path,
-) -> List[Tuple[str, Optional[Document]]]:
+) -> List[Tuple[str, "Optional[Document]"]]:
     """Process URLs in parallel.
 
     Args:
@@ -340,12 +462,12 @@ def _process_urls(
 
 
 async def _process_urls_async(
-    extractor: Extractor,
+    extractor: "Extractor",
     urls: List[str],
     workers: int,
     format: str,
     output_path: Path,
-) -> List[Tuple[str, Optional[Document]]]:
+) -> List[Tuple[str, "Optional[Document]"]]:
     """Process URLs asynchronously.
 
     Args:
@@ -358,28 +480,47 @@ async def _process_urls_async(
     Returns:
         List[Tuple[str, Optional[Document]]]: List of (url, document) pairs
     """
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold blue]{task.description}"),
-        TextColumn("[bold yellow]{task.completed}/{task.total}"),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("[bold green]Extracting content...", total=len(urls))
-        
-        results = await extractor.extract_batch_async(urls, max_workers=workers)
-        
-        for url, document in results:
-            if document:
-                _save_document(document, url, format, output_path)
-                
-            progress.update(task, advance=1)
-            
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[bold blue]{task.description}"),
+            TextColumn("[bold yellow]{task.completed}/{task.total}"),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(
+                "[bold green]Extracting content...", total=len(urls)
+            )
+
+            results = await extractor.extract_batch_async(urls, max_workers=workers)
+
+            # Saving is blocking disk I/O; run it in worker threads so the
+            # event loop isn't stalled and writes overlap each other
+            write_tasks = []
+            for url, document in results:
+                if document:
+                    write_tasks.append(
+                        asyncio.create_task(
+                            asyncio.to_thread(
+                                _save_document, document, url, format, output_path
+                            )
+                        )
+                    )
+
+                progress.update(task, advance=1)
+
+            if write_tasks:
+                await asyncio.gather(*write_tasks)
+    finally:
+        # The shared aiohttp session is bound to this event loop, which
+        # ends when asyncio.run returns, so close it before leaving
+        await extractor.aclose()
+
     return results
 
 
 def _save_document(
-    document: Document, url: str, format: str, output_path: Path
+    document: "Document", url: str, format: str, output_path: Path
 ) -> None:
     """Save document to file.
 
@@ -390,15 +531,12 @@ def _save_document(
         output_path: Output directory path
     """
     # Generate safe filename from URL
-    import re
-    from urllib.parse import urlparse
-    
     parsed = urlparse(url)
     domain = parsed.netloc
     
     # Create a path with domain as subdirectory
     domain_path = output_path / domain
-    domain_path.mkdir(exist_ok=True)
+    _ensure_dir(domain_path)
     
     # Create filename from path
     path = parsed.path
@@ -408,10 +546,10 @@ def _save_document(
         # Remove extension and convert to filename
         path = path.rstrip("/")
         basename = os.path.basename(path)
-        filename = re.sub(r"\.[^.]+$", "", basename)
-        
+        filename = _EXT_RE.sub("", basename)
+
         # Remove special characters
-        filename = re.sub(r"[^\w\-]", "_", filename)
+        filename = _SAFE_RE.sub("_", filename)
         
     # Add extension based on format
     ext = {
@@ -421,16 +559,11 @@ def _save_document(
         "html": ".html",
     }.get(format, ".md")
     
-    # Create full path
-    file_path = domain_path / f"{filename}{ext}"
-    
-    # If file exists, add numeric suffix
-    counter = 1
-    original_path = file_path
-    while file_path.exists():
-        file_path = original_path.with_name(f"{filename}_{counter}{ext}")
-        counter += 1
-        
+    # Disambiguate with a short URL hash instead of stat-looping for a
+    # free numeric suffix: deterministic, re-runnable, zero syscalls
+    suffix = hashlib.blake2b(url.encode("utf-8"), digest_size=4).hexdigest()
+    file_path = domain_path / f"{filename}_{suffix}{ext}"
+
     # Save document
     document.save(file_path, format=format)
 
@@ -492,14 +625,20 @@ def process_html(
         config_dict["formatting"] = {}
     config_dict["formatting"]["line_width"] = width
     
-    # Read HTML file
+    # Read HTML file; stream large files so memory stays bounded
     try:
-        with open(html_file, "r", encoding="utf-8") as f:
-            html = f.read()
+        html = None
+        if os.path.getsize(html_file) > _LARGE_HTML_THRESHOLD:
+            html = _stream_extract_content(html_file)
+        if html is None:
+            with open(html_file, "r", encoding="utf-8") as f:
+                html = f.read()
     except Exception as e:
         console.print(f"[bold red]Error reading HTML file:[/] {e}")
         sys.exit(1)
     
+    from webdom_extractor import Extractor
+
     with console.status("[bold green]Extracting content...", spinner="dots"):
         try:
             extractor = Extractor(config=config_dict)
@@ -510,16 +649,7 @@ def process_html(
     
     # Get content in requested format
     try:
-        if format == "json":
-            content = document.to_json(pretty=True)
-        elif format == "markdown":
-            content = document.to_markdown()
-        elif format == "text":
-            content = document.to_text()
-        elif format == "html":
-            content = document.content.html
-        else:
-            content = document.to_markdown()
+        content = _FORMATTERS.get(format, _FORMATTERS["markdown"])(document)
     except Exception as e:
         console.print(f"[bold red]Error formatting output:[/] {e}")
         sys.exit(1)
@@ -529,8 +659,10 @@ def process_html(
         try:
             path = Path(output)
             path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Binary mode with a large buffer skips the TextIOWrapper
+            # incremental-encode loop: one encode, one buffered write
+            with open(path, "wb", buffering=1 << 20) as f:
+                f.write(content.encode("utf-8"))
             console.print(f"[bold green]Content saved to {output}")
         except Exception as e:
             console.print(f"[bold red]Error writing to file:[/] {e}")
@@ -551,6 +683,8 @@ def process_html(
 @click.pass_context
 def check(ctx: click.Context, parser_path: Optional[str]) -> None:
     """Check if the environment is properly configured."""
+    from webdom_extractor import Extractor
+
     # Check if Postlight Parser is installed
     try:
         extractor = Extractor(parser_path=parser_path)
@@ -570,7 +704,7 @@ def check(ctx: click.Context, parser_path: Optional[str]) -> None:
     dependencies = [
         "html2text",
         "requests",
-        "aiohttp", 
+        "aiohttp",
         "beautifulsoup4",
         "lxml",
         "pydantic",
@@ -578,14 +712,25 @@ def check(ctx: click.Context, parser_path: Optional[str]) -> None:
         "rich",
         "diskcache",
     ]
-    
-    for dep in dependencies:
+
+    def _try_import(dep: str) -> bool:
         try:
             __import__(dep)
-            console.print(f"[bold green]✓[/] {dep} installed")
+            return True
         except ImportError:
+            return False
+
+    # Imports spend most of their time in C-extension init and disk I/O,
+    # so probing them concurrently collapses wall time to the slowest one
+    with ThreadPoolExecutor(max_workers=len(dependencies)) as executor:
+        results = list(executor.map(_try_import, dependencies))
+
+    for dep, installed in zip(dependencies, results):
+        if installed:
+            console.print(f"[bold green]✓[/] {dep} installed")
+        else:
             console.print(f"[bold red]✗[/] {dep} not installed")
-            
+
     console.print("[bold green]Environment check completed")
 
 
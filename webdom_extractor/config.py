@@ -5,13 +5,28 @@ type validation and serialization.
 """
 
 import os
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Union
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 DEFAULT_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".webdom", "config.json")
 
+# Allowed-value sets, hoisted to module scope for O(1) membership checks
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_HEADING_STYLES = frozenset({"atx", "setext"})
+_VALID_CODE_BLOCK_STYLES = frozenset({"fenced", "indented"})
 
-class ExtractionConfig(BaseModel):
+
+# The sub-configs are validated once at startup and then read on every
+# extraction, so they are slotted frozen dataclasses rather than full
+# pydantic models: attribute access stays a plain slot lookup and all
+# range checks run as a single __post_init__ call per instance instead
+# of one dispatched validator per constrained field. Config below
+# remains a pydantic model and handles coercion from loaded JSON dicts.
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionConfig:
     """Configuration for content extraction."""
 
     preserve_images: bool = True
@@ -27,22 +42,16 @@ class ExtractionConfig(BaseModel):
     user_agent: str = "WebDOM-Extractor/1.0"
     custom_headers: Optional[Dict[str, str]] = None
 
-    @validator("min_text_length")
-    def validate_min_text_length(cls, v):
-        """Validate minimum text length."""
-        if v < 0:
+    def __post_init__(self):
+        """Validate field ranges."""
+        if self.min_text_length < 0:
             raise ValueError("min_text_length must be non-negative")
-        return v
-
-    @validator("timeout_seconds")
-    def validate_timeout(cls, v):
-        """Validate timeout."""
-        if v <= 0:
+        if self.timeout_seconds <= 0:
             raise ValueError("timeout_seconds must be positive")
-        return v
 
 
-class FormattingConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class FormattingConfig:
     """Configuration for content formatting."""
 
     line_width: Optional[int] = 80
@@ -56,15 +65,22 @@ class FormattingConfig(BaseModel):
     add_source_url: bool = True
     add_date: bool = True
 
-    @validator("line_width")
-    def validate_line_width(cls, v):
-        """Validate line width."""
-        if v is not None and v < 20:
+    def __post_init__(self):
+        """Validate field ranges and allowed values."""
+        if self.line_width is not None and self.line_width < 20:
             raise ValueError("line_width must be at least 20 if specified")
-        return v
-
-
-class CacheConfig(BaseModel):
+        if self.heading_style not in _VALID_HEADING_STYLES:
+            raise ValueError(
+                f"heading_style must be one of {sorted(_VALID_HEADING_STYLES)}"
+            )
+        if self.code_block_style not in _VALID_CODE_BLOCK_STYLES:
+            raise ValueError(
+                f"code_block_style must be one of {sorted(_VALID_CODE_BLOCK_STYLES)}"
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class CacheConfig:
     """Configuration for content caching."""
 
     enabled: bool = True
@@ -72,22 +88,16 @@ class CacheConfig(BaseModel):
     max_size: int = 1_000_000_000  # 1GB
     cache_dir: Optional[str] = None
 
-    @validator("ttl_seconds")
-    def validate_ttl(cls, v):
-        """Validate TTL."""
-        if v < 0:
+    def __post_init__(self):
+        """Validate field ranges."""
+        if self.ttl_seconds < 0:
             raise ValueError("ttl_seconds must be non-negative")
-        return v
-
-    @validator("max_size")
-    def validate_max_size(cls, v):
-        """Validate max size."""
-        if v < 0:
+        if self.max_size < 0:
             raise ValueError("max_size must be non-negative")
-        return v
 
 
-class ParallelConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ParallelConfig:
     """Configuration for parallel processing."""
 
     enabled: bool = True
@@ -95,28 +105,38 @@ class ParallelConfig(BaseModel):
     max_retries: int = 3
     retry_delay_seconds: int = 1
 
-    @validator("max_workers")
-    def validate_max_workers(cls, v):
-        """Validate max workers."""
-        if v <= 0:
+    def __post_init__(self):
+        """Validate field ranges."""
+        if self.max_workers <= 0:
             raise ValueError("max_workers must be positive")
-        return v
+
+
+# Shared default sub-configs. The models are frozen, so every Config()
+# built without overrides can reference the same instances instead of
+# re-validating a fresh model per construction.
+_DEFAULT_EXTRACTION = ExtractionConfig()
+_DEFAULT_FORMATTING = FormattingConfig()
+_DEFAULT_CACHE = CacheConfig()
+_DEFAULT_PARALLEL = ParallelConfig()
 
 
 class Config(BaseModel):
     """Main configuration model for WebDOM Extractor."""
 
-    extraction: ExtractionConfig = Field(default_factory=ExtractionConfig)
-    formatting: FormattingConfig = Field(default_factory=FormattingConfig)
-    cache: CacheConfig = Field(default_factory=CacheConfig)
-    parallel: ParallelConfig = Field(default_factory=ParallelConfig)
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    extraction: ExtractionConfig = Field(default_factory=lambda: _DEFAULT_EXTRACTION)
+    formatting: FormattingConfig = Field(default_factory=lambda: _DEFAULT_FORMATTING)
+    cache: CacheConfig = Field(default_factory=lambda: _DEFAULT_CACHE)
+    parallel: ParallelConfig = Field(default_factory=lambda: _DEFAULT_PARALLEL)
     postlight_parser_path: Optional[str] = None
     log_level: str = "INFO"
 
-    @validator("log_level")
-    def validate_log_level(cls, v):
+    @field_validator("log_level")
+    @classmethod
+    def validate_log_level(cls, v: str) -> str:
         """Validate log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}")
-        return v.upper()
+        upper = v.upper()
+        if upper not in _VALID_LOG_LEVELS:
+            raise ValueError(f"log_level must be one of {sorted(_VALID_LOG_LEVELS)}")
+        return upper
@@ -3,23 +3,143 @@ import hashlib
 import json
 import logging
 import os
+import queue
+import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlparse, urlsplit
 
 import aiohttp
 import diskcache
+import lxml.html
 import requests
-import validators
-from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from lxml import etree
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from webdom_extractor.config import Config, ExtractionConfig
 from webdom_extractor.document import Document
 
 logger = logging.getLogger(__name__)
 
+# Hot entries kept in process memory ahead of the diskcache SQLite layer
+MEMORY_CACHE_SIZE = 256
+
+# Minimum amount of extracted text (in characters) for the in-process
+# extraction to be considered successful before falling back to the
+# Postlight Parser subprocess.
+MIN_INPROCESS_CONTENT_LENGTH = 200
+
+# Results below this word count are not admitted to the caches: error
+# pages and login walls would otherwise crowd out real articles.
+MIN_CACHE_WORD_COUNT = 50
+
+# XPath expressions compiled once at import time so repeated extractions
+# don't pay recompilation cost per call.
+_TITLE_XPATH = etree.XPath("//title/text()")
+_ARTICLE_XPATH = etree.XPath('//article | //main | //*[@role="main"]')
+_CANDIDATE_XPATH = etree.XPath("//div | //section")
+_META_CONTENT_XPATH = etree.XPath(
+    '//meta[@name=$name or @property=$name]/@content'
+)
+# Union of the semantic and id/class container queries: one C-level
+# document scan returns every candidate in document order, instead of a
+# second full walk when the semantic query comes up empty
+_MAIN_CONTAINER_XPATH = etree.XPath(
+    '//article | //main | //*[@role="main"] | '
+    '//*[@id="content" or @id="main" or @id="article"] | '
+    '//*[contains(concat(" ", normalize-space(@class), " "), " content ") or '
+    'contains(concat(" ", normalize-space(@class), " "), " main ") or '
+    'contains(concat(" ", normalize-space(@class), " "), " article ")]'
+)
+_NOISE_XPATH = etree.XPath(
+    "//nav | //header | //footer | //aside | //script | //style | "
+    "//noscript | //iframe"
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_url(url: str) -> bool:
+    """Check that a URL has a supported scheme and a host.
+
+    A structural urlsplit check instead of the validators package's
+    per-call regex machinery; memoized since batch sessions revisit
+    the same URLs.
+
+    Args:
+        url: URL to check
+
+    Returns:
+        bool: True if the URL looks fetchable
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    if parts.scheme == "file":
+        return bool(parts.path)
+    return parts.scheme in ("http", "https") and bool(parts.netloc)
+
+
+def _build_session() -> requests.Session:
+    """Build the shared HTTP session with connection pooling and retries.
+
+    A single session keeps TCP/TLS connections alive across requests, so
+    repeated fetches to the same host skip the handshake cost.
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared session reused for all synchronous fetches
+_SESSION = _build_session()
+
+# Node shim that keeps a single parser process alive for a whole batch
+_PARSER_DAEMON_SCRIPT = os.path.join(
+    os.path.dirname(__file__), "parser_daemon.js"
+)
+
 
 class ExtractionError(Exception):
     """Exception raised when content extraction fails."""
@@ -88,6 +208,42 @@ class Extractor:
             self._init_cache()
         else:
             self.cache = None
+            self._tree_cache = None
+
+        # Hot in-memory LRU in front of the disk cache: a dict hit costs
+        # nanoseconds where the SQLite roundtrip costs ~10us
+        self._mem_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._mem_cache_lock = threading.Lock()
+
+        # Reused zstd contexts for disk cache compression; creating a
+        # compressor per entry would dominate the cost of small payloads
+        if zstandard is not None:
+            self._zstd_compressor = zstandard.ZstdCompressor(level=3)
+            self._zstd_decompressor = zstandard.ZstdDecompressor()
+
+        # Pool of persistent parser daemons, spawned lazily up to
+        # _daemon_limit so concurrent batch workers each get their own
+        # Node process instead of serializing on a single pipe
+        self._daemon_pool: "queue.LifoQueue[subprocess.Popen]" = queue.LifoQueue()
+        self._daemon_count = 0
+        self._daemon_limit = min(
+            self.config.parallel.max_workers, os.cpu_count() or 1
+        )
+        self._parser_lock = threading.Lock()
+        # Latched when a daemon exits without ever serving a request
+        # (broken Node environment), so we stop paying a doomed ~100ms
+        # spawn per parse and go straight to one-shot mode
+        self._daemon_unavailable = False
+
+        # Dedicated executor for subprocess-path parses in async mode,
+        # sized to the daemon pool so parser work neither starves nor
+        # is starved by the event loop's default executor
+        self._parser_executor: Optional[ThreadPoolExecutor] = None
+
+        # Shared aiohttp session, created lazily on first async use and
+        # reused so connections (TCP + TLS) persist across batches
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
 
         logger.info(f"Extractor initialized with parser at {self.parser_path}")
 
@@ -114,18 +270,37 @@ class Extractor:
             cache_dir = os.path.join(os.path.expanduser("~"), ".webdom", "cache")
             
         os.makedirs(cache_dir, exist_ok=True)
-        
+
+        # LRU eviction suits the workload's temporal locality; the
+        # default least-recently-stored policy would evict hot entries
+        # that were written long ago. Expired keys are swept
+        # opportunistically on insert, so no external cleanup is needed.
         self.cache = diskcache.Cache(
             cache_dir,
             size_limit=self.config.cache.max_size,
             cull_limit=10,  # Remove 10% when size limit is reached
+            eviction_policy="least-recently-used",
         )
-        
+
+        # Second layer storing serialized HTML trees so re-extraction of a
+        # known URL (e.g. a format change) skips both network and parse
+        self._tree_cache = diskcache.Cache(
+            os.path.join(cache_dir, "trees"),
+            size_limit=self.config.cache.max_size,
+            cull_limit=10,
+            eviction_policy="least-recently-used",
+        )
+
         logger.info(f"Cache initialized at {cache_dir}")
 
-    def _find_parser_path(self) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _find_parser_path() -> str:
         """Find the Postlight Parser executable path.
 
+        Memoized so repeated Extractor constructions don't re-run the
+        PATH search and filesystem probes.
+
         Returns:
             str: Path to the Postlight Parser executable
 
@@ -148,29 +323,13 @@ class Extractor:
                 os.path.join(os.path.expanduser("~"), "AppData", "Roaming", "npm", "postlight-parser.cmd"),
             ])
             
-        # Try to find in PATH
-        try:
-            if os.name == "nt":
-                result = subprocess.run(
-                    ["where", "postlight-parser"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                paths = result.stdout.strip().split("\n")
-                if paths:
-                    return paths[0]
-            else:
-                result = subprocess.run(
-                    ["which", "postlight-parser"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                return result.stdout.strip()
-        except (subprocess.SubprocessError, FileNotFoundError):
-            logger.debug("Could not find postlight-parser in PATH")
-            
+        # Try to find in PATH without forking a which/where subprocess
+        path = shutil.which("postlight-parser")
+        if path:
+            return path
+        logger.debug("Could not find postlight-parser in PATH")
+
+
         # Check common paths
         for path in common_paths:
             if os.path.exists(path):
@@ -181,11 +340,17 @@ class Extractor:
             "npm install -g @postlight/parser"
         )
 
-    def extract_url(self, url: str) -> Document:
+    def extract_url(
+        self,
+        url: str,
+        _cache_buffer: Optional[List[Tuple[str, Dict[str, Any], str]]] = None,
+    ) -> Document:
         """Extract content from a URL.
 
         Args:
             url: URL to extract content from
+            _cache_buffer: Internal batch-mode sink for deferred disk
+                cache writes
 
         Returns:
             Document: Extracted document
@@ -196,31 +361,46 @@ class Extractor:
             ExtractionError: If extraction fails
         """
         # Validate URL
-        if not validators.url(url):
+        if not _is_valid_url(url):
             raise ValueError(f"Invalid URL: {url}")
             
         logger.info(f"Extracting content from URL: {url}")
         
-        # Check cache if enabled
-        if self.cache:
+        # Check cache if enabled (memory layer first, then disk)
+        if self.cache is not None:
             cache_key = self._get_cache_key(url)
-            cached_data = self.cache.get(cache_key)
+            cached_data = self._mem_cache_get(cache_key)
+            if cached_data is None:
+                cached_data = self._decode_cache_entry(self.cache.get(cache_key))
+                if cached_data:
+                    self._mem_cache_put(cache_key, cached_data)
             if cached_data:
                 logger.info(f"Using cached content for {url}")
                 return self._document_from_cache(cached_data)
-        
+
         # Run parser
         try:
             parser_result = self._run_parser(url)
-            
-            # Cache result if enabled
-            if self.cache:
-                self.cache.set(
-                    cache_key,
-                    parser_result,
-                    expire=self.config.cache.ttl_seconds,
-                )
-                
+
+            # Cache result if enabled and worth keeping
+            if self.cache is not None and self._should_cache(parser_result):
+                if _cache_buffer is not None:
+                    # Batch mode: defer the SQLite write so the whole
+                    # batch commits in one transaction
+                    _cache_buffer.append(
+                        (cache_key, parser_result, urlparse(url).netloc)
+                    )
+                else:
+                    # Tagged by domain so cache.evict(tag=domain) can
+                    # flush a whole site cheaply
+                    self.cache.set(
+                        cache_key,
+                        self._encode_cache_entry(parser_result),
+                        expire=self.config.cache.ttl_seconds,
+                        tag=urlparse(url).netloc,
+                    )
+                self._mem_cache_put(cache_key, parser_result)
+
             return self._create_document(parser_result, url)
         except Exception as e:
             logger.error(f"Error extracting content from {url}: {e}")
@@ -245,55 +425,86 @@ class Extractor:
         
         if not html:
             raise ExtractionError("Empty HTML content")
-            
-        # Save HTML to temporary file for parser
-        import tempfile
-        
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", suffix=".html", delete=False
-        ) as f:
-            f.write(html)
-            temp_path = f.name
-            
-        try:
-            # Run parser on the temporary file
-            file_url = f"file://{temp_path}"
-            parser_result = self._run_parser(file_url)
-            
-            # If URL was provided, update the result
-            if url:
-                parser_result["url"] = url
-                
-            return self._create_document(parser_result, url)
-        finally:
-            # Clean up temporary file
+
+        # Stream the HTML straight into a pooled parser daemon: no disk
+        # write, Node fs read, or unlink per call
+        request = json.dumps({"url": url or "http://localhost/", "html": html})
+        parser_result = self._daemon_request(request)
+
+        if parser_result is None:
+            # No daemon available: fall back to the tempfile round-trip
+            import tempfile
+
+            with tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", suffix=".html", delete=False
+            ) as f:
+                f.write(html)
+                temp_path = f.name
+
             try:
-                os.unlink(temp_path)
-            except Exception as e:
-                logger.warning(f"Failed to remove temporary file {temp_path}: {e}")
+                file_url = f"file://{temp_path}"
+                parser_result = self._run_parser(file_url)
+            finally:
+                try:
+                    os.unlink(temp_path)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to remove temporary file {temp_path}: {e}"
+                    )
+
+        # If URL was provided, update the result
+        if url:
+            parser_result["url"] = url
+
+        return self._create_document(parser_result, url)
 
     def extract_batch(
         self, urls: List[str], max_workers: Optional[int] = None
-    ) -> List[Tuple[str, Optional[Document]]]:
+    ) -> Iterator[Tuple[str, Optional[Document]]]:
         """Extract content from multiple URLs in parallel.
 
+        Results are yielded in completion order rather than submission
+        order, so one slow URL doesn't hold back everything queued after
+        it.
+
         Args:
             urls: List of URLs to extract content from
             max_workers: Maximum number of parallel workers
 
-        Returns:
-            List[Tuple[str, Optional[Document]]]: List of (url, document) pairs
+        Yields:
+            Tuple[str, Optional[Document]]: (url, document) pairs as each
+                extraction completes
         """
         if not urls:
-            return []
-            
+            return
+
         workers = max_workers or self.config.parallel.max_workers
         logger.info(f"Batch extracting {len(urls)} URLs with {workers} workers")
-        
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            results = list(executor.map(self._safe_extract, urls))
-            
-        return list(zip(urls, results))
+
+        # Workers append cache writes here instead of each committing to
+        # SQLite; the whole batch is flushed in one transaction below
+        cache_buffer: Optional[List[Tuple[str, Dict[str, Any], str]]] = (
+            [] if self.cache is not None else None
+        )
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._safe_extract, url, cache_buffer): url
+                    for url in urls
+                }
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+        finally:
+            if cache_buffer:
+                with self.cache.transact():
+                    for cache_key, parser_result, domain in cache_buffer:
+                        self.cache.set(
+                            cache_key,
+                            self._encode_cache_entry(parser_result),
+                            expire=self.config.cache.ttl_seconds,
+                            tag=domain,
+                        )
 
     async def extract_batch_async(
         self, urls: List[str], max_workers: Optional[int] = None
@@ -309,24 +520,133 @@ class Extractor:
         """
         if not urls:
             return []
-            
+
         workers = max_workers or self.config.parallel.max_workers
         logger.info(f"Async batch extracting {len(urls)} URLs with {workers} tasks")
-        
-        tasks = []
+
         semaphore = asyncio.Semaphore(workers)
-        
+        session = await self._get_session()
+
         async def _extract_with_semaphore(url):
             async with semaphore:
-                return url, await self._safe_extract_async(url)
-                
-        for url in urls:
-            tasks.append(_extract_with_semaphore(url))
-            
-        return await asyncio.gather(*tasks)
+                return url, await self._safe_extract_async(url, session=session)
+
+        return await asyncio.gather(
+            *(_extract_with_semaphore(url) for url in urls)
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it lazily.
+
+        The session lives for the extractor's lifetime so keep-alive
+        connections and the DNS cache persist across batches instead of
+        being torn down per call. Sessions are bound to an event loop;
+        if the running loop changed since creation the old session is
+        closed and a fresh one is built.
+
+        Returns:
+            aiohttp.ClientSession: Shared session for this extractor
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._aio_session is None
+            or self._aio_session.closed
+            or self._aio_loop is not loop
+        ):
+            if self._aio_session is not None and not self._aio_session.closed:
+                await self._aio_session.close()
+            connector = aiohttp.TCPConnector(
+                limit=1024,
+                limit_per_host=64,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            )
+            self._aio_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=self.config.extraction.timeout_seconds
+                ),
+            )
+            self._aio_loop = loop
+        return self._aio_session
+
+    async def aclose(self) -> None:
+        """Close the shared aiohttp session, if one was created."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+        self._aio_loop = None
+
+    async def __aenter__(self) -> "Extractor":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def _fetch_html_async(
+        self, url: str, session: aiohttp.ClientSession
+    ) -> str:
+        """Fetch raw HTML for a URL asynchronously with retries.
+
+        Retries transient failures with exponential backoff, honoring the
+        Retry-After header when the server provides one.
+
+        Args:
+            url: URL to fetch
+            session: aiohttp session to use
+
+        Returns:
+            str: HTML content
+
+        Raises:
+            FetchError: If fetching fails after all retries
+        """
+        headers = {"User-Agent": self.config.extraction.user_agent}
+        if self.config.extraction.custom_headers:
+            headers.update(self.config.extraction.custom_headers)
+
+        max_retries = self.config.parallel.max_retries
+        delay = self.config.parallel.retry_delay_seconds
+
+        last_error: Optional[Exception] = None
+        for attempt in range(max_retries + 1):
+            try:
+                async with session.get(
+                    url,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(
+                        total=self.config.extraction.timeout_seconds
+                    ),
+                    allow_redirects=self.config.extraction.follow_redirects,
+                ) as response:
+                    if response.status in (429, 503) and attempt < max_retries:
+                        retry_after = response.headers.get("Retry-After")
+                        wait = delay * (2 ** attempt)
+                        if retry_after and retry_after.isdigit():
+                            wait = int(retry_after)
+                        logger.debug(
+                            f"Got {response.status} for {url}, "
+                            f"retrying in {wait}s"
+                        )
+                        await asyncio.sleep(wait)
+                        continue
+                    response.raise_for_status()
+                    return await response.text()
+            except aiohttp.ClientError as e:
+                last_error = e
+                if attempt < max_retries:
+                    await asyncio.sleep(delay * (2 ** attempt))
+
+        raise FetchError(f"Failed to fetch {url}: {last_error}")
 
     def _run_parser(self, url: str) -> Dict[str, Any]:
-        """Run the Postlight Parser on a URL.
+        """Extract content from a URL.
+
+        Tries the in-process lxml extraction path first, which avoids the
+        ~100ms Node.js startup cost per URL. Falls back to the Postlight
+        Parser subprocess when in-process extraction yields too little
+        content to be trustworthy.
 
         Args:
             url: URL to parse
@@ -335,37 +655,483 @@ class Extractor:
             Dict: Parser result
 
         Raises:
-            PostlightParserError: If parser fails
+            PostlightParserError: If all extraction methods fail
+        """
+        try:
+            html = None
+            tree_key = None
+            if self._tree_cache is not None:
+                tree_key = hashlib.blake2b(url.encode("utf-8")).hexdigest()
+                cached_html = self._tree_cache.get(tree_key)
+                if cached_html is not None:
+                    logger.debug(f"Using cached HTML tree for {url}")
+                    html = cached_html.decode("utf-8")
+
+            if html is None:
+                html = self._fetch_html(url)
+                if self._tree_cache is not None:
+                    self._tree_cache.set(
+                        tree_key,
+                        html.encode("utf-8"),
+                        expire=self.config.cache.ttl_seconds,
+                    )
+
+            result = self._lxml_extract(html, url)
+            content_text = result.get("_content_text", "")
+            result.pop("_content_text", None)
+            if len(content_text) >= MIN_INPROCESS_CONTENT_LENGTH:
+                return result
+            logger.debug(
+                f"In-process extraction yielded only {len(content_text)} chars "
+                f"for {url}, falling back to Postlight Parser"
+            )
+        except Exception as e:
+            logger.debug(f"In-process extraction failed for {url}: {e}")
+
+        return self._run_parser_subprocess(url)
+
+    def _fetch_html(self, url: str) -> str:
+        """Fetch raw HTML for a URL.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            str: HTML content
+
+        Raises:
+            FetchError: If fetching fails
+        """
+        headers = {"User-Agent": self.config.extraction.user_agent}
+        if self.config.extraction.custom_headers:
+            headers.update(self.config.extraction.custom_headers)
+
+        try:
+            response = _SESSION.get(
+                url,
+                headers=headers,
+                timeout=self.config.extraction.timeout_seconds,
+                allow_redirects=self.config.extraction.follow_redirects,
+            )
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            raise FetchError(f"Failed to fetch {url}: {e}")
+
+    def _lxml_extract(self, html: str, url: str) -> Dict[str, Any]:
+        """Extract content and metadata from HTML using lxml.
+
+        Uses precompiled XPath expressions against libxml2's C parser, so
+        tree construction and search never touch per-node Python objects.
+        Content selection prefers semantic containers (<article>, <main>,
+        role="main") and falls back to the div/section with the highest
+        text density.
+
+        Args:
+            html: HTML content to extract from
+            url: Source URL
+
+        Returns:
+            Dict: Parser-style result with an extra "_content_text" key
+                holding the extracted plain text (used to judge quality)
+
+        Raises:
+            ExtractionError: If the HTML cannot be parsed
+        """
+        try:
+            tree = lxml.html.fromstring(html)
+        except (etree.ParserError, ValueError) as e:
+            raise ExtractionError(f"Failed to parse HTML: {e}")
+
+        # Prefer semantic content containers
+        container = None
+        candidates = _ARTICLE_XPATH(tree)
+        if candidates:
+            container = max(
+                candidates, key=lambda el: len(el.text_content())
+            )
+        else:
+            # Fall back to the div/section with the most direct text
+            best_length = 0
+            for el in _CANDIDATE_XPATH(tree):
+                length = len(el.text_content())
+                if length > best_length:
+                    best_length = length
+                    container = el
+
+        if container is None:
+            container = tree.find("body")
+        if container is None:
+            container = tree
+
+        content_text = " ".join(container.text_content().split())
+
+        result: Dict[str, Any] = {
+            "url": url,
+            "domain": url.split("//")[-1].split("/")[0],
+            "content": lxml.html.tostring(container, encoding="unicode"),
+            "word_count": len(content_text.split()),
+            "_content_text": content_text,
+        }
+
+        titles = _TITLE_XPATH(tree)
+        if titles:
+            result["title"] = titles[0].strip()
+
+        og_title = _META_CONTENT_XPATH(tree, name="og:title")
+        if og_title:
+            result["title"] = og_title[0]
+
+        description = _META_CONTENT_XPATH(tree, name="description")
+        if description:
+            result["excerpt"] = description[0]
+
+        og_desc = _META_CONTENT_XPATH(tree, name="og:description")
+        if og_desc:
+            result["excerpt"] = og_desc[0]
+
+        og_image = _META_CONTENT_XPATH(tree, name="og:image")
+        if og_image:
+            result["lead_image_url"] = og_image[0]
+
+        author = _META_CONTENT_XPATH(tree, name="author")
+        if author:
+            result["author"] = author[0]
+
+        return result
+
+    def _daemon_env(self) -> Dict[str, str]:
+        """Build the environment for parser daemon processes.
+
+        The daemon script lives inside this package, where Node's
+        require() cannot see globally-installed npm modules, so
+        NODE_PATH is pointed at the module tree of the npm prefix the
+        parser executable was found under.
+
+        Returns:
+            Dict[str, str]: Environment with NODE_PATH set when a
+                global module tree exists next to the parser
+        """
+        env = os.environ.copy()
+        bin_dir = os.path.dirname(os.path.abspath(self.parser_path))
+        candidates = [
+            # Unix global installs: <prefix>/bin/... and <prefix>/lib/node_modules
+            os.path.join(os.path.dirname(bin_dir), "lib", "node_modules"),
+            # Windows npm and local node_modules/.bin layouts keep the
+            # module tree next to the executables
+            os.path.join(bin_dir, "node_modules"),
+            os.path.dirname(bin_dir) if os.path.basename(bin_dir) == ".bin" else "",
+        ]
+        node_paths = [p for p in candidates if p and os.path.isdir(p)]
+        if env.get("NODE_PATH"):
+            node_paths.append(env["NODE_PATH"])
+        if node_paths:
+            env["NODE_PATH"] = os.pathsep.join(node_paths)
+        return env
+
+    def _spawn_daemon(self) -> Optional[subprocess.Popen]:
+        """Start one parser daemon process.
+
+        Each Node process serves many parses over its stdin/stdout
+        pipes, amortizing the ~100ms interpreter startup.
+
+        Returns:
+            Optional[subprocess.Popen]: Running daemon, or None if it
+                could not be started
         """
-        logger.debug(f"Running Postlight Parser on {url}")
-        
         try:
+            # Binary pipes: responses stay bytes end-to-end so orjson
+            # parses them without an intermediate str decode
+            proc = subprocess.Popen(
+                ["node", _PARSER_DAEMON_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+                env=self._daemon_env(),
+            )
+            logger.debug(f"Started parser daemon (pid {proc.pid})")
+            return proc
+        except OSError as e:
+            logger.debug(f"Could not start parser daemon: {e}")
+            return None
+
+    def _acquire_daemon(self) -> Optional[subprocess.Popen]:
+        """Check a parser daemon out of the pool.
+
+        Reuses an idle daemon when one is available, spawns a new one
+        while under the pool limit, and otherwise waits for a daemon to
+        be returned. Dead daemons found in the pool are discarded.
+
+        Returns:
+            Optional[subprocess.Popen]: Checked-out daemon, or None if
+                none could be obtained
+        """
+        while True:
+            try:
+                proc = self._daemon_pool.get_nowait()
+            except queue.Empty:
+                break
+            if proc.poll() is None:
+                return proc
+            with self._parser_lock:
+                self._daemon_count -= 1
+
+        with self._parser_lock:
+            can_spawn = self._daemon_count < self._daemon_limit
+            if can_spawn:
+                self._daemon_count += 1
+
+        if can_spawn:
+            proc = self._spawn_daemon()
+            if proc is None:
+                with self._parser_lock:
+                    self._daemon_count -= 1
+            return proc
+
+        # Pool is at capacity; wait for a worker to return one
+        try:
+            proc = self._daemon_pool.get(
+                timeout=self.config.extraction.timeout_seconds
+            )
+        except queue.Empty:
+            return None
+        if proc.poll() is None:
+            return proc
+        with self._parser_lock:
+            self._daemon_count -= 1
+        return None
+
+    def _note_daemon_failure(self, proc: subprocess.Popen) -> None:
+        """Discard a failed daemon, disabling the pool if it never worked.
+
+        A daemon that exits without ever answering a request points at a
+        broken Node environment (typically require() not resolving
+        @postlight/parser); latching _daemon_unavailable stops every
+        later parse from paying a doomed spawn before its one-shot
+        fallback.
+
+        Args:
+            proc: Daemon process whose request failed
+        """
+        # EOF on the pipe can race the process teardown, so give the
+        # daemon a moment to be reapable instead of trusting poll()
+        try:
+            proc.wait(timeout=0.1)
+            exited = True
+        except subprocess.TimeoutExpired:
+            exited = False
+        if exited and not getattr(proc, "served_request", False):
+            self._daemon_unavailable = True
+            logger.warning(
+                "Parser daemon exited before serving a request; disabling "
+                "the daemon pool (is @postlight/parser resolvable by node?)"
+            )
+        self._discard_daemon(proc)
+
+    def _discard_daemon(self, proc: subprocess.Popen) -> None:
+        """Terminate a broken daemon and release its pool slot.
+
+        Args:
+            proc: Daemon process to discard
+        """
+        try:
+            proc.terminate()
+        except OSError:
+            pass
+        with self._parser_lock:
+            self._daemon_count -= 1
+
+    def _daemon_request(self, request: str) -> Optional[Dict[str, Any]]:
+        """Send one line-framed request to a pooled parser daemon.
+
+        Args:
+            request: A bare URL, or a JSON object line with pre-fetched
+                HTML (see parser_daemon.js)
+
+        Returns:
+            Optional[Dict]: Parser result, or None if no daemon is
+                available
+
+        Raises:
+            PostlightParserError: If the daemon reports a parse error
+        """
+        if self._daemon_unavailable:
+            return None
+
+        proc = self._acquire_daemon()
+        if proc is None:
+            return None
+
+        try:
+            proc.stdin.write(request.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+        except (OSError, ValueError) as e:
+            logger.debug(f"Parser daemon I/O failed: {e}")
+            self._note_daemon_failure(proc)
+            return None
+
+        if not line:
+            # Daemon died mid-request; fall back to one-shot mode
+            self._note_daemon_failure(proc)
+            return None
+
+        # Mark the handshake as proven so a later crash of this daemon
+        # isn't mistaken for a broken environment
+        proc.served_request = True
+        self._daemon_pool.put(proc)
+
+        try:
+            if orjson is not None:
+                result = orjson.loads(line)
+            else:
+                result = json.loads(line)
+        except ValueError as e:
+            raise PostlightParserError(f"Invalid parser output: {e}")
+
+        if "error" in result:
+            raise PostlightParserError(
+                f"Parser error: {result.get('message', 'Unknown error')}"
+            )
+
+        return result
+
+    def close(self) -> None:
+        """Shut down idle parser daemons and the parser executor."""
+        if self._parser_executor is not None:
+            self._parser_executor.shutdown(wait=False)
+            self._parser_executor = None
+        while True:
+            try:
+                proc = self._daemon_pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                proc.terminate()
+            except OSError:
+                pass
+            with self._parser_lock:
+                self._daemon_count -= 1
+
+    def __del__(self) -> None:
+        """Clean up the parser daemon on garbage collection."""
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _spawn_parser(self, url: str) -> bytes:
+        """Run one parser process and capture its stdout.
+
+        Uses ``os.posix_spawn`` where available: unlike fork+exec it
+        skips copying the parent's address space, which matters once
+        the extractor holds large in-memory caches.
+
+        Args:
+            url: URL to pass to the parser executable
+
+        Returns:
+            bytes: Raw parser stdout
+
+        Raises:
+            subprocess.CalledProcessError: If the parser exits non-zero
+        """
+        if not hasattr(os, "posix_spawn"):
             result = subprocess.run(
                 [self.parser_path, url],
                 capture_output=True,
-                text=True,
                 check=True,
             )
-            output = result.stdout
-            
-            # Extract JSON from output
-            json_start = output.find("{")
+            return result.stdout
+
+        read_fd, write_fd = os.pipe()
+        try:
+            pid = os.posix_spawn(
+                self.parser_path,
+                [self.parser_path, url],
+                dict(os.environ),
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, write_fd, 1),
+                    (os.POSIX_SPAWN_CLOSE, read_fd),
+                ],
+            )
+        except OSError:
+            os.close(read_fd)
+            os.close(write_fd)
+            raise
+        os.close(write_fd)
+
+        chunks = []
+        try:
+            while True:
+                chunk = os.read(read_fd, 1 << 16)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(read_fd)
+
+        _, status = os.waitpid(pid, 0)
+        exitcode = os.waitstatus_to_exitcode(status)
+        if exitcode != 0:
+            raise subprocess.CalledProcessError(
+                exitcode, [self.parser_path, url]
+            )
+        return b"".join(chunks)
+
+    def _run_parser_subprocess(self, url: str) -> Dict[str, Any]:
+        """Run the Postlight Parser subprocess on a URL.
+
+        Prefers the persistent daemon; falls back to a one-shot process
+        when the daemon cannot be started.
+
+        Args:
+            url: URL to parse
+
+        Returns:
+            Dict: Parser result
+
+        Raises:
+            PostlightParserError: If parser fails
+        """
+        daemon_result = self._daemon_request(url)
+        if daemon_result is not None:
+            return daemon_result
+
+        logger.debug(f"Running Postlight Parser on {url}")
+
+        try:
+            # Keep stdout as bytes: orjson parses them directly, so the
+            # JSON payload is never decoded to str first
+            output = self._spawn_parser(url)
+
+            # Extract JSON from output without slicing a second copy of
+            # the (potentially multi-MB) payload
+            json_start = output.find(b"{")
             if json_start == -1:
-                raise PostlightParserError(f"No JSON found in parser output: {output}")
-                
-            parser_result = json.loads(output[json_start:])
-            
+                raise PostlightParserError(f"No JSON found in parser output: {output!r}")
+
+            if orjson is not None:
+                # memoryview: orjson parses straight from the buffer
+                parser_result = orjson.loads(memoryview(output)[json_start:])
+            else:
+                text = output.decode("utf-8")
+                parser_result, _ = json.JSONDecoder().raw_decode(
+                    text, text.find("{")
+                )
+
             # Check for parser error
             if "error" in parser_result:
                 raise PostlightParserError(
                     f"Parser error: {parser_result.get('message', 'Unknown error')}"
                 )
-                
+
             return parser_result
         except subprocess.SubprocessError as e:
             error_output = getattr(e, "stderr", str(e))
             raise PostlightParserError(f"Parser process error: {error_output}")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise PostlightParserError(f"Invalid parser output: {e}")
 
     def _create_document(
@@ -380,13 +1146,16 @@ class Extractor:
         Returns:
             Document: Extracted document
         """
-        content_html = parser_result.pop("content", "")
-        
+        # Split content from metadata without mutating the caller's
+        # dict, which may also be referenced by the cache layers
+        content_html = parser_result.get("content", "")
+        metadata = {k: v for k, v in parser_result.items() if k != "content"}
+
         # Use URL from parser result or provided URL
-        final_url = parser_result.get("url") or url
-        
-        # Create document
-        doc = Document(content_html, parser_result, final_url)
+        final_url = metadata.get("url") or url
+
+        # Create document (parser output is trusted, skip validation)
+        doc = Document(content_html, metadata, final_url, trusted=True)
         
         logger.info(
             f"Created document: {doc.metadata.title or '[No Title]'} "
@@ -395,16 +1164,124 @@ class Extractor:
         
         return doc
 
+    def _encode_cache_entry(
+        self, parser_result: Dict[str, Any]
+    ) -> Union[Dict[str, Any], bytes]:
+        """Serialize a parser result for the disk cache.
+
+        With zstandard installed, entries are stored as zstd-compressed
+        JSON: extracted HTML compresses 3-5x, so several times more
+        documents fit in the same size_limit before eviction kicks in.
+        Without it, the dict is stored as-is via diskcache's pickling.
+
+        Args:
+            parser_result: Parser result to serialize
+
+        Returns:
+            Union[Dict, bytes]: Compressed blob, or the original dict
+        """
+        if zstandard is None:
+            return parser_result
+        if orjson is not None:
+            payload = orjson.dumps(parser_result)
+        else:
+            payload = json.dumps(parser_result).encode("utf-8")
+        return self._zstd_compressor.compress(payload)
+
+    def _decode_cache_entry(
+        self, cached_data: Union[Dict[str, Any], bytes]
+    ) -> Optional[Dict[str, Any]]:
+        """Deserialize a disk cache entry.
+
+        Handles both compressed blobs and plain dicts, so caches
+        written with or without zstandard installed stay readable.
+
+        Args:
+            cached_data: Raw cache entry
+
+        Returns:
+            Optional[Dict]: Parser result, or None if the entry cannot
+                be decoded (treated as a cache miss)
+        """
+        if not isinstance(cached_data, bytes):
+            return cached_data
+        if zstandard is None:
+            return None
+        try:
+            payload = self._zstd_decompressor.decompress(cached_data)
+            if orjson is not None:
+                return orjson.loads(payload)
+            return json.loads(payload)
+        except (zstandard.ZstdError, ValueError) as e:
+            logger.warning(f"Discarding undecodable cache entry: {e}")
+            return None
+
+    @staticmethod
+    def _should_cache(parser_result: Dict[str, Any]) -> bool:
+        """Decide whether a parser result is worth caching.
+
+        Admission policy: error templates and near-empty pages (login
+        walls, soft 404s) would pollute both cache layers and evict
+        real articles, so only substantial results are admitted. A
+        missing word count does not block admission, since not every
+        parser output includes one.
+
+        Args:
+            parser_result: Parser result to evaluate
+
+        Returns:
+            bool: True if the result should be cached
+        """
+        if not parser_result.get("content"):
+            return False
+        word_count = parser_result.get("word_count")
+        return word_count is None or word_count >= MIN_CACHE_WORD_COUNT
+
+    def _mem_cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a parser result in the in-memory LRU layer.
+
+        Args:
+            cache_key: Cache key to look up
+
+        Returns:
+            Optional[Dict]: Cached parser result or None
+        """
+        with self._mem_cache_lock:
+            cached = self._mem_cache.get(cache_key)
+            if cached is not None:
+                self._mem_cache.move_to_end(cache_key)
+            return cached
+
+    def _mem_cache_put(self, cache_key: str, data: Dict[str, Any]) -> None:
+        """Store a parser result in the in-memory LRU layer.
+
+        Args:
+            cache_key: Cache key to store under
+            data: Parser result to store
+        """
+        with self._mem_cache_lock:
+            self._mem_cache[cache_key] = data
+            self._mem_cache.move_to_end(cache_key)
+            while len(self._mem_cache) > MEMORY_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+
     def _get_cache_key(self, url: str) -> str:
         """Generate a cache key for a URL.
 
+        A URL-to-blob map only needs collision resistance, not a
+        cryptographic hash, so this prefers SIMD-accelerated xxh3 and
+        falls back to blake2b — both well ahead of MD5.
+
         Args:
             url: URL to generate cache key for
 
         Returns:
-            str: Cache key
+            str: Cache key (128-bit hex digest)
         """
-        return hashlib.md5(url.encode("utf-8")).hexdigest()
+        encoded = url.encode("utf-8")
+        if xxhash is not None:
+            return xxhash.xxh3_128_hexdigest(encoded)
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
     def _document_from_cache(self, cached_data: Dict[str, Any]) -> Document:
         """Create a Document from cached data.
@@ -415,8 +1292,9 @@ class Extractor:
         Returns:
             Document: Extracted document
         """
-        content_html = cached_data.pop("content", "")
-        return Document(content_html, cached_data)
+        content_html = cached_data.get("content", "")
+        metadata = {k: v for k, v in cached_data.items() if k != "content"}
+        return Document(content_html, metadata, trusted=True)
 
     def _fallback_extraction(self, url: str) -> Document:
         """Fallback extraction method when parser fails.
@@ -438,24 +1316,18 @@ class Extractor:
             if self.config.extraction.custom_headers:
                 headers.update(self.config.extraction.custom_headers)
                 
-            response = requests.get(
+            response = _SESSION.get(
                 url,
                 headers=headers,
                 timeout=self.config.extraction.timeout_seconds,
                 allow_redirects=self.config.extraction.follow_redirects,
             )
             response.raise_for_status()
-            
-            # Parse with BeautifulSoup
-            html = response.text
-            soup = BeautifulSoup(html, "lxml")
-            
-            # Extract metadata
-            metadata = self._extract_fallback_metadata(soup, url, response)
-            
-            # Extract main content
-            content_html = self._extract_fallback_content(soup)
-            
+
+            metadata, content_html = self._fallback_extract_combined(
+                response.text, url
+            )
+
             return Document(content_html, metadata, url)
         except requests.RequestException as e:
             raise FetchError(f"Failed to fetch {url}: {e}")
@@ -468,139 +1340,266 @@ class Extractor:
                 url,
             )
 
+    def _fallback_extract_combined(
+        self, html: str, url: str
+    ) -> Tuple[Dict[str, Any], str]:
+        """Extract fallback metadata and content from one parse.
+
+        Prefers selectolax (Modest C engine) when installed: the
+        document is parsed once and all meta tags are collected in a
+        single walk instead of one query per field. Without selectolax
+        the html is parsed once with lxml and the tree is shared by the
+        metadata and content helpers.
+
+        Args:
+            html: Raw page HTML
+            url: Source URL
+
+        Returns:
+            Tuple[Dict, str]: (metadata, content_html)
+        """
+        if _SelectolaxParser is None:
+            tree = lxml.html.fromstring(html)
+            return (
+                self._extract_fallback_metadata(tree, url),
+                self._extract_fallback_content(tree),
+            )
+
+        tree = _SelectolaxParser(html)
+        metadata: Dict[str, Any] = {
+            "url": url,
+            "domain": url.split("//")[-1].split("/")[0],
+        }
+
+        # One walk over the meta tags; first occurrence wins per name
+        meta_values: Dict[str, str] = {}
+        for node in tree.css("meta"):
+            name = node.attributes.get("name") or node.attributes.get("property")
+            content = node.attributes.get("content")
+            if name and content and name not in meta_values:
+                meta_values[name] = content
+
+        title_node = tree.css_first("title")
+        title = meta_values.get("og:title") or (
+            title_node.text().strip() if title_node else None
+        )
+        if title:
+            metadata["title"] = title
+
+        excerpt = meta_values.get("og:description") or meta_values.get(
+            "description"
+        )
+        if excerpt:
+            metadata["excerpt"] = excerpt
+        if "og:image" in meta_values:
+            metadata["lead_image_url"] = meta_values["og:image"]
+        if "author" in meta_values:
+            metadata["author"] = meta_values["author"]
+
+        body = tree.body
+        if body is not None:
+            metadata["word_count"] = len(body.text(separator=" ").split())
+
+        # Content: semantic containers first, then a cleaned body
+        main = (
+            tree.css_first("article")
+            or tree.css_first("main")
+            or tree.css_first('[role="main"]')
+        )
+        if main is None and body is not None:
+            for noise in body.css("script, style, nav, header, footer, aside"):
+                noise.decompose()
+            main = body
+        content_html = main.html if main is not None else "<p>No content found</p>"
+
+        return metadata, content_html
+
     def _extract_fallback_metadata(
-        self, soup: BeautifulSoup, url: str, response: requests.Response
+        self, tree: lxml.html.HtmlElement, url: str
     ) -> Dict[str, Any]:
-        """Extract metadata from HTML using fallback method.
+        """Extract metadata from a parsed tree using fallback method.
+
+        All lookups use XPath expressions precompiled at import time, so
+        searches run in libxml2 C code rather than per-node Python.
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed lxml HTML tree
             url: Source URL
-            response: HTTP response
 
         Returns:
             Dict: Metadata
         """
         metadata = {"url": url, "domain": url.split("//")[-1].split("/")[0]}
-        
+
         # Title
-        title_tag = soup.find("title")
-        if title_tag:
-            metadata["title"] = title_tag.text.strip()
-            
+        titles = _TITLE_XPATH(tree)
+        if titles:
+            metadata["title"] = titles[0].strip()
+
         # Meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc:
-            metadata["excerpt"] = meta_desc.get("content", "")
-            
+        description = _META_CONTENT_XPATH(tree, name="description")
+        if description:
+            metadata["excerpt"] = description[0]
+
         # Open Graph metadata
-        og_title = soup.find("meta", property="og:title")
+        og_title = _META_CONTENT_XPATH(tree, name="og:title")
         if og_title:
-            metadata["title"] = og_title.get("content", metadata.get("title", ""))
-            
-        og_desc = soup.find("meta", property="og:description")
+            metadata["title"] = og_title[0]
+
+        og_desc = _META_CONTENT_XPATH(tree, name="og:description")
         if og_desc:
-            metadata["excerpt"] = og_desc.get("content", metadata.get("excerpt", ""))
-            
-        og_image = soup.find("meta", property="og:image")
+            metadata["excerpt"] = og_desc[0]
+
+        og_image = _META_CONTENT_XPATH(tree, name="og:image")
         if og_image:
-            metadata["lead_image_url"] = og_image.get("content", "")
-            
+            metadata["lead_image_url"] = og_image[0]
+
         # Author
-        author = soup.find("meta", attrs={"name": "author"})
+        author = _META_CONTENT_XPATH(tree, name="author")
         if author:
-            metadata["author"] = author.get("content", "")
-            
-        # Count words in visible text
-        visible_text = " ".join(soup.stripped_strings)
-        metadata["word_count"] = len(visible_text.split())
-        
+            metadata["author"] = author[0]
+
+        # Count words in visible text; str.split tokenizes on any
+        # whitespace run, so no normalized copy needs building first
+        metadata["word_count"] = len(tree.text_content().split())
+
         return metadata
 
-    def _extract_fallback_content(self, soup: BeautifulSoup) -> str:
-        """Extract main content from HTML using fallback method.
+    def _extract_fallback_content(self, tree: lxml.html.HtmlElement) -> str:
+        """Extract main content from a parsed tree using fallback method.
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed lxml HTML tree
 
         Returns:
             str: Extracted HTML content
         """
-        # Try to find main content container
+        # Find the main content container in one scan; semantic
+        # containers (<article>, <main>, role=main) still win over
+        # id/class conventions regardless of document order
         main_content = None
-        
-        # Check for common content containers
-        for container in [
-            soup.find("main"),
-            soup.find("article"),
-            soup.find(id="content"),
-            soup.find(class_="content"),
-            soup.find(id="main"),
-            soup.find(class_="main"),
-            soup.find(id="article"),
-            soup.find(class_="article"),
-        ]:
-            if container:
-                main_content = container
+        for candidate in _MAIN_CONTAINER_XPATH(tree):
+            if candidate.tag in ("article", "main") or (
+                candidate.get("role") == "main"
+            ):
+                main_content = candidate
                 break
-                
+            if main_content is None:
+                main_content = candidate
+
         # If no content container found, use body
-        if not main_content:
-            main_content = soup.find("body")
-            
-            # Remove common noise elements
-            for element in main_content.select(
-                "nav, header, footer, aside, script, style, noscript, iframe"
-            ):
-                element.decompose()
-                
+        if main_content is None:
+            main_content = tree.find("body")
+
+            if main_content is not None:
+                # Remove common noise elements
+                for element in _NOISE_XPATH(main_content):
+                    parent = element.getparent()
+                    if parent is not None:
+                        parent.remove(element)
+
         # Convert to string
-        return str(main_content) if main_content else "<p>No content found</p>"
+        if main_content is None:
+            return "<p>No content found</p>"
+        return lxml.html.tostring(main_content, encoding="unicode")
 
-    def _safe_extract(self, url: str) -> Optional[Document]:
+    def _safe_extract(
+        self,
+        url: str,
+        cache_buffer: Optional[List[Tuple[str, Dict[str, Any], str]]] = None,
+    ) -> Optional[Document]:
         """Safely extract content from a URL, catching exceptions.
 
         Args:
             url: URL to extract from
+            cache_buffer: Optional batch-mode sink for deferred disk
+                cache writes
 
         Returns:
             Optional[Document]: Extracted document or None if extraction fails
         """
         try:
-            return self.extract_url(url)
+            return self.extract_url(url, _cache_buffer=cache_buffer)
         except Exception as e:
             logger.error(f"Failed to extract {url}: {e}")
             return None
 
-    async def _safe_extract_async(self, url: str) -> Optional[Document]:
+    async def _run_on_parser_executor(
+        self, runner: Callable[[str], Dict[str, Any]], url: str
+    ) -> Dict[str, Any]:
+        """Run a blocking parser entry point on the dedicated executor.
+
+        The parser blocks on subprocess pipes, so it runs on the lazily
+        created parser thread pool instead of the event loop.
+
+        Args:
+            runner: Blocking parser callable taking the URL
+            url: URL to parse
+
+        Returns:
+            Dict: Parser result
+        """
+        loop = asyncio.get_running_loop()
+        if self._parser_executor is None:
+            self._parser_executor = ThreadPoolExecutor(
+                max_workers=self._daemon_limit,
+                thread_name_prefix="parser",
+            )
+        return await loop.run_in_executor(self._parser_executor, runner, url)
+
+    async def _safe_extract_async(
+        self, url: str, session: Optional[aiohttp.ClientSession] = None
+    ) -> Optional[Document]:
         """Asynchronously extract content from a URL, catching exceptions.
 
         Args:
             url: URL to extract from
+            session: Optional shared aiohttp session for connection reuse
 
         Returns:
             Optional[Document]: Extracted document or None if extraction fails
         """
         try:
-            # Run parser in a thread pool since it's a subprocess call
-            loop = asyncio.get_event_loop()
-            parser_result = await loop.run_in_executor(None, self._run_parser, url)
-            
+            if session is not None:
+                # Fetch over the shared session, parse in-process
+                html = await self._fetch_html_async(url, session)
+                parser_result = self._lxml_extract(html, url)
+                content_text = parser_result.pop("_content_text", "")
+                if len(content_text) < MIN_INPROCESS_CONTENT_LENGTH:
+                    # Too little content to be trustworthy: consult the
+                    # Postlight Parser like the sync path does, before
+                    # considering the naive fallback
+                    logger.debug(
+                        f"In-process extraction yielded only "
+                        f"{len(content_text)} chars for {url}, falling "
+                        f"back to Postlight Parser"
+                    )
+                    parser_result = await self._run_on_parser_executor(
+                        self._run_parser_subprocess, url
+                    )
+            else:
+                parser_result = await self._run_on_parser_executor(
+                    self._run_parser, url
+                )
+
             return self._create_document(parser_result, url)
         except Exception as e:
             logger.error(f"Failed to extract {url} asynchronously: {e}")
             try:
                 # Try fallback
-                return await self._fallback_extraction_async(url)
+                return await self._fallback_extraction_async(url, session=session)
             except Exception as fallback_e:
                 logger.error(f"Fallback extraction failed for {url}: {fallback_e}")
                 return None
 
-    async def _fallback_extraction_async(self, url: str) -> Document:
+    async def _fallback_extraction_async(
+        self, url: str, session: Optional[aiohttp.ClientSession] = None
+    ) -> Document:
         """Asynchronous fallback extraction method.
 
         Args:
             url: URL to extract content from
+            session: Optional shared aiohttp session for connection reuse
 
         Returns:
             Document: Extracted document
@@ -609,39 +1608,20 @@ class Extractor:
             FetchError: If fetching fails
         """
         logger.info(f"Using async fallback extraction for {url}")
-        
+
         try:
-            # Fetch the page
-            headers = {"User-Agent": self.config.extraction.user_agent}
-            if self.config.extraction.custom_headers:
-                headers.update(self.config.extraction.custom_headers)
-                
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(
-                        total=self.config.extraction.timeout_seconds
-                    ),
-                    allow_redirects=self.config.extraction.follow_redirects,
-                ) as response:
-                    response.raise_for_status()
-                    html = await response.text()
-                    
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(html, "lxml")
-            
-            # Extract metadata (simplified for async version)
-            metadata = {
-                "url": url,
-                "domain": url.split("//")[-1].split("/")[0],
-                "title": (soup.find("title").text.strip() if soup.find("title") else ""),
-            }
-            
-            # Extract main content
-            content_html = self._extract_fallback_content(soup)
-            
+            # Fetch the page over the shared session
+            if session is None:
+                session = await self._get_session()
+            html = await self._fetch_html_async(url, session)
+
+            # Same single-parse routine as the sync path, so both legs
+            # pick up the selectolax fast path when it is installed
+            metadata, content_html = self._fallback_extract_combined(html, url)
+
             return Document(content_html, metadata, url)
+        except FetchError:
+            raise
         except aiohttp.ClientError as e:
             raise FetchError(f"Failed to fetch {url}: {e}")
         except Exception as e:
@@ -1,16 +1,242 @@
 import enum
+import io
 import json
 import logging
+import re
 import textwrap
+import threading
+from functools import lru_cache
 from html import unescape
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 import bleach
+import lxml.html
 from html2text import HTML2Text
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    from htmd import convert_html as _htmd_convert
+except ImportError:
+    _htmd_convert = None
+
 logger = logging.getLogger(__name__)
 
 
+def _compile_cleanup(pattern: str):
+    """Compile a cleanup pattern, preferring RE2 when installed.
+
+    RE2 matches in linear time, so pathological inputs cannot trigger
+    backtracking blowups in the greedy cleanup patterns. Patterns using
+    features RE2 lacks (lookarounds) silently fall back to stdlib re.
+
+    Args:
+        pattern: Regular expression source
+
+    Returns:
+        Compiled pattern object
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+# Exact JSON-safe primitive types, checked by identity in the sanitize
+# fast path: a set lookup on type(v) is cheaper than an isinstance chain
+_JSON_PRIM_SET = frozenset({str, int, float, bool, type(None)})
+
+# Cleanup patterns, compiled once at import instead of per call. The
+# text rules are independent, so they are fused into one alternation
+# and cleanup makes a single pass over the buffer; the markdown list
+# rule depends on blank lines already being collapsed, so it stays a
+# second pass.
+_RE_BLANK_LINES = _compile_cleanup(r"\n{3,}")
+_RE_LIST_SPACING = _compile_cleanup(r"(\n\s*\*.*\n)\n+(\s*\*)")
+_RE_TEXT_CLEAN = _compile_cleanup(r"[ \t\r]+(?=\n)|\n{3,}")
+
+# Script/style scrubber for plain-text extraction; the backreference
+# rules out RE2, so this one always compiles with stdlib re
+_RE_SCRIPT_STYLE = re.compile(
+    r"<(script|style)\b[^>]*>.*?</\1>", re.IGNORECASE | re.DOTALL
+)
+
+# Entity decoding: the five entities below cover nearly everything that
+# survives convert_charrefs, so they get a single compiled pass; only
+# an ampersand opening some other entity forces the full html.unescape
+_RE_COMMON_ENTITIES = re.compile(r"&(amp|lt|gt|quot|#39);")
+_RE_RARE_ENTITY = re.compile(r"&(?!(?:amp|lt|gt|quot|#39);)[#A-Za-z]")
+_COMMON_ENTITY_MAP = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "#39": "'"}
+
+
+def _common_entity_repl(match: "re.Match[str]") -> str:
+    """Replacement for _RE_COMMON_ENTITIES."""
+    return _COMMON_ENTITY_MAP[match.group(1)]
+
+
+def _fast_unescape(text: str) -> str:
+    """Decode HTML entities left in converter output.
+
+    Args:
+        text: Converter output, usually entity-free
+
+    Returns:
+        str: Text with entities decoded
+    """
+    if "&" not in text:
+        return text
+    if _RE_RARE_ENTITY.search(text):
+        return unescape(text)
+    return _RE_COMMON_ENTITIES.sub(_common_entity_repl, text)
+
+
+def _text_clean_repl(match: "re.Match[str]") -> str:
+    """Replacement for _RE_TEXT_CLEAN: strip trailing ws, collapse blanks."""
+    return "\n\n" if match.group(0)[0] == "\n" else ""
+
+# Sanitizer allow-lists for the HTML output branch, built once. The
+# base sets come from bleach as frozensets, so union rather than list
+# concatenation.
+_HTML_TAGS = frozenset(bleach.sanitizer.ALLOWED_TAGS) | {
+    'div', 'span', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'table', 'thead', 'tbody', 'tr', 'th', 'td',
+    'ul', 'ol', 'li', 'dl', 'dt', 'dd',
+    'img', 'figure', 'figcaption', 'main', 'article',
+    'section', 'aside', 'details', 'summary',
+}
+_HTML_ATTRS = {
+    **bleach.sanitizer.ALLOWED_ATTRIBUTES,
+    'img': ['src', 'alt', 'title', 'width', 'height'],
+    'a': ['href', 'title', 'rel'],
+    '*': ['class', 'id'],
+}
+
+# Per-thread cache of stateful converter objects. HTML2Text mutates
+# parser state inside handle() and bleach's Cleaner does the same in
+# clean(), so instances must never be shared between threads.
+_THREAD_CACHE = threading.local()
+
+
+def _get_html_cleaner() -> "bleach.sanitizer.Cleaner":
+    """Return the sanitizing Cleaner for the current thread.
+
+    bleach.clean builds a Cleaner (and its html5lib parser) from
+    scratch on every call, so one is kept around instead — per thread,
+    because the parser inside a Cleaner has internal state and bleach
+    documents the object as not thread-safe.
+
+    Returns:
+        bleach.sanitizer.Cleaner: Cleaner private to the calling thread
+    """
+    try:
+        return _THREAD_CACHE.html_cleaner
+    except AttributeError:
+        cleaner = bleach.sanitizer.Cleaner(
+            tags=_HTML_TAGS, attributes=_HTML_ATTRS
+        )
+        _THREAD_CACHE.html_cleaner = cleaner
+        return cleaner
+
+
+@lru_cache(maxsize=256)
+def _cached_html_clean(html: str) -> str:
+    """Sanitize HTML for the HTML output branch, memoized per payload.
+
+    bleach.clean reparses its input with html5lib on every call, so
+    pipelines that reprocess duplicate fragments pay the full parse each
+    time. lru_cache keys on the input string itself, which covers both
+    the hash and the equality check.
+
+    Args:
+        html: HTML content to sanitize
+
+    Returns:
+        str: Sanitized HTML
+    """
+    return _get_html_cleaner().clean(html)
+
+
+def _get_html2text(
+    body_width: Optional[int],
+    ignore_images: bool = False,
+    ignore_links: bool = False,
+    ignore_emphasis: bool = False,
+    use_atx_headers: bool = True,
+    code_block_style: str = "fenced",
+    inline_links: bool = True,
+    protect_links: bool = False,
+    unicode_snob: bool = False,
+    preserve_newlines: bool = False,
+) -> HTML2Text:
+    """Return a configured HTML2Text instance, cached per option set.
+
+    Constructing and configuring HTML2Text dominates formatting cost for
+    small documents, so instances are reused across documents — but only
+    within a thread, because handle() mutates the instance while it
+    runs. Each thread keeps its own table of configured converters.
+
+    Args:
+        body_width: Character width for line wrapping (0/None disables)
+        ignore_images: Whether to drop images from the output
+        ignore_links: Whether to drop links from the output
+        ignore_emphasis: Whether to drop bold/italic markers
+        use_atx_headers: Whether to emit atx (#) style headings
+        code_block_style: 'fenced' or 'indented' code blocks
+        inline_links: Whether to emit inline rather than reference links
+        protect_links: Whether to guard links from line wrapping
+        unicode_snob: Whether to prefer unicode over ASCII equivalents
+        preserve_newlines: Whether to preserve line breaks in the HTML
+
+    Returns:
+        HTML2Text: Configured converter, private to the calling thread
+    """
+    key = (
+        body_width,
+        ignore_images,
+        ignore_links,
+        ignore_emphasis,
+        use_atx_headers,
+        code_block_style,
+        inline_links,
+        protect_links,
+        unicode_snob,
+        preserve_newlines,
+    )
+    try:
+        cache = _THREAD_CACHE.html2text
+    except AttributeError:
+        cache = _THREAD_CACHE.html2text = {}
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    formatter = HTML2Text()
+    formatter.body_width = body_width
+    formatter.ignore_images = ignore_images
+    formatter.ignore_links = ignore_links
+    formatter.ignore_emphasis = ignore_emphasis
+    formatter.convert_charrefs = True
+    formatter.wrap_links = False
+    formatter.use_atx_headers = use_atx_headers
+    formatter.code_block_style = code_block_style
+    formatter.ignore_tables = False
+    formatter.inline_links = inline_links
+    formatter.protect_links = protect_links
+    formatter.unicode_snob = unicode_snob
+    formatter.preserve_newlines = preserve_newlines
+    cache[key] = formatter
+    return formatter
+
+
 class OutputFormat(str, enum.Enum):
     """Supported output formats."""
 
@@ -20,6 +246,12 @@ class OutputFormat(str, enum.Enum):
     HTML = "html"
 
 
+# String-to-member table and the error-message name list, built once;
+# a dict probe beats the enum constructor's member lookup per call
+_FORMAT_BY_STR = {f.value: f for f in OutputFormat}
+_FORMAT_NAMES = ", ".join(_FORMAT_BY_STR)
+
+
 class MarkdownFormatter:
     """Formatter for converting HTML to Markdown."""
 
@@ -30,6 +262,7 @@ class MarkdownFormatter:
         wrap_blocks: bool = True,
         code_block_style: str = "fenced",
         preserve_emphasis: bool = True,
+        backend: str = "html2text",
     ):
         """Initialize the Markdown formatter.
 
@@ -39,26 +272,39 @@ class MarkdownFormatter:
             wrap_blocks: Whether to wrap text in blocks
             code_block_style: 'fenced' (```) or 'indented' (4 spaces) code blocks
             preserve_emphasis: Whether to preserve bold, italic, etc.
+            backend: 'html2text' (default) or 'htmd' for the Rust
+                converter, which is much faster on large inputs but
+                ignores the layout options above
+
+        Raises:
+            ValueError: If an unknown backend is requested
         """
-        self.formatter = HTML2Text()
-        self.formatter.body_width = body_width
-        self.formatter.ignore_images = False
-        self.formatter.ignore_links = False
-        self.formatter.ignore_emphasis = not preserve_emphasis
-        self.formatter.convert_charrefs = True
-        self.formatter.wrap_links = False
-        
-        # Configure heading style
-        self.formatter.use_atx_headers = (heading_style.lower() == "atx")
-        
-        # Configure code block style
-        self.formatter.code_block_style = code_block_style
-        
-        # Configure wrapping
+        if backend not in ("html2text", "htmd"):
+            raise ValueError(f"Unknown markdown backend: {backend}")
+        if backend == "htmd" and _htmd_convert is None:
+            logger.warning("htmd is not installed, falling back to html2text")
+            backend = "html2text"
+        self.backend = backend
+
         if not wrap_blocks:
-            self.formatter.body_width = 0
-            
-        logger.debug(f"Initialized MarkdownFormatter with body_width={body_width}")
+            body_width = 0
+
+        # Only the option values live on the instance; the stateful
+        # converter is resolved per call so instances can be shared
+        # (and memoized) across threads
+        self._converter_options = dict(
+            body_width=body_width,
+            ignore_emphasis=not preserve_emphasis,
+            use_atx_headers=(heading_style.lower() == "atx"),
+            code_block_style=code_block_style,
+        )
+
+        logger.debug("Initialized MarkdownFormatter with body_width=%s", body_width)
+
+    @property
+    def formatter(self) -> HTML2Text:
+        """Thread-local HTML2Text configured with this instance's options."""
+        return _get_html2text(**self._converter_options)
 
     def convert(self, html: str) -> str:
         """Convert HTML to Markdown.
@@ -69,19 +315,28 @@ class MarkdownFormatter:
         Returns:
             str: Markdown formatted content
         """
+        if not html or html.isspace():
+            return ""
+
         try:
-            markdown = self.formatter.handle(html)
-            # Clean up the markdown output
-            markdown = unescape(markdown)
+            if self.backend == "htmd":
+                markdown = _htmd_convert(html)
+            else:
+                markdown = self.formatter.handle(html)
+            # Clean up the markdown output; convert_charrefs already
+            # decoded entities, so this is normally a no-op scan
+            markdown = _fast_unescape(markdown)
             markdown = self._cleanup_markdown(markdown)
             return markdown
         except Exception as e:
             logger.error(f"Error converting HTML to Markdown: {e}")
             # Fallback to a simplified conversion
-            simple_formatter = HTML2Text()
-            simple_formatter.ignore_images = True
-            simple_formatter.ignore_links = True
-            simple_formatter.ignore_emphasis = True
+            simple_formatter = _get_html2text(
+                78,
+                ignore_images=True,
+                ignore_links=True,
+                ignore_emphasis=True,
+            )
             return unescape(simple_formatter.handle(html))
             
     def _cleanup_markdown(self, markdown: str) -> str:
@@ -94,13 +349,10 @@ class MarkdownFormatter:
             str: Cleaned markdown
         """
         # Fix multiple consecutive blank lines
-        import re
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
-        
+        markdown = _RE_BLANK_LINES.sub('\n\n', markdown)
+
         # Fix list item spacing
-        markdown = re.sub(r'(\n\s*\*.*\n)\n+(\s*\*)', r'\1\2', markdown)
-        
-        return markdown
+        return _RE_LIST_SPACING.sub(r'\1\2', markdown)
 
 
 class TextFormatter:
@@ -117,19 +369,25 @@ class TextFormatter:
             body_width: Character width for line wrapping (None for no wrapping)
             preserve_line_breaks: Whether to preserve line breaks in the HTML
         """
-        self.formatter = HTML2Text()
-        self.formatter.body_width = body_width
-        self.formatter.ignore_images = True
-        self.formatter.ignore_links = True
-        self.formatter.ignore_emphasis = True
-        self.formatter.convert_charrefs = True
-        self.formatter.ignore_tables = False
-        self.formatter.inline_links = False
-        self.formatter.protect_links = True
-        self.formatter.unicode_snob = True
-        self.formatter.preserve_newlines = preserve_line_breaks
-        
-        logger.debug(f"Initialized TextFormatter with body_width={body_width}")
+        # As in MarkdownFormatter, keep only options on the instance and
+        # resolve the thread-local converter per call
+        self._converter_options = dict(
+            body_width=body_width,
+            ignore_images=True,
+            ignore_links=True,
+            ignore_emphasis=True,
+            inline_links=False,
+            protect_links=True,
+            unicode_snob=True,
+            preserve_newlines=preserve_line_breaks,
+        )
+
+        logger.debug("Initialized TextFormatter with body_width=%s", body_width)
+
+    @property
+    def formatter(self) -> HTML2Text:
+        """Thread-local HTML2Text configured with this instance's options."""
+        return _get_html2text(**self._converter_options)
 
     def convert(self, html: str) -> str:
         """Convert HTML to plain text.
@@ -140,24 +398,30 @@ class TextFormatter:
         Returns:
             str: Plain text formatted content
         """
+        if not html or html.isspace():
+            return ""
+
         try:
-            # First, sanitize HTML to remove potentially harmful content
-            html = bleach.clean(html, strip=True)
+            # Scrub script/style blocks with one compiled pass; the old
+            # bleach pre-sanitize ran a full html5lib parse only for
+            # html2text to parse the result all over again, and plain
+            # text output needs no markup policy beyond this
+            html = _RE_SCRIPT_STYLE.sub("", html)
             
             # Convert to plain text
             text = self.formatter.handle(html)
             
-            # Clean up the text output
-            text = unescape(text)
+            # Clean up the text output; entities were already decoded
+            # by convert_charrefs, so this is normally a no-op scan
+            text = _fast_unescape(text)
             text = self._cleanup_text(text)
             
             return text
         except Exception as e:
             logger.error(f"Error converting HTML to plain text: {e}")
-            # Fallback to a very basic conversion
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, "lxml")
-            return soup.get_text(separator="\n")
+            # Fallback to a very basic conversion; text_content() is a
+            # single C traversal, unlike bs4's Python-level get_text()
+            return lxml.html.fromstring(html).text_content()
             
     def _cleanup_text(self, text: str) -> str:
         """Clean up the generated plain text.
@@ -168,14 +432,12 @@ class TextFormatter:
         Returns:
             str: Cleaned text
         """
-        # Fix multiple consecutive blank lines
-        import re
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        # Remove trailing whitespace
-        text = "\n".join(line.rstrip() for line in text.splitlines())
-        
-        return text
+        # Fix blank-line runs and trailing whitespace in one pass
+        text = _RE_TEXT_CLEAN.sub(_text_clean_repl, text)
+
+        # The lookahead only fires before a newline, so also trim
+        # whitespace dangling at the very end of the string
+        return text.rstrip(" \t\r")
 
 
 class JsonFormatter:
@@ -188,7 +450,7 @@ class JsonFormatter:
             pretty: Whether to format the JSON with indentation
         """
         self.pretty = pretty
-        logger.debug(f"Initialized JsonFormatter with pretty={pretty}")
+        logger.debug("Initialized JsonFormatter with pretty=%s", pretty)
 
     def convert(self, data: Dict[str, Any]) -> str:
         """Convert data to JSON.
@@ -200,6 +462,15 @@ class JsonFormatter:
             str: JSON formatted data
         """
         try:
+            if orjson is not None:
+                # C serializer writing UTF-8 directly; also handles
+                # datetimes natively before the default callback runs
+                option = orjson.OPT_INDENT_2 if self.pretty else 0
+                return orjson.dumps(
+                    data,
+                    default=self._json_serialize,
+                    option=option,
+                ).decode("utf-8")
             indent = 2 if self.pretty else None
             return json.dumps(
                 data,
@@ -213,6 +484,38 @@ class JsonFormatter:
             safe_data = self._sanitize_for_json(data)
             return json.dumps(safe_data, ensure_ascii=False)
             
+    def convert_to(self, data: Dict[str, Any], fp) -> None:
+        """Serialize data as JSON directly into a binary file object.
+
+        Avoids materializing the whole JSON document as a Python string
+        when the caller is writing to a file or socket anyway: the
+        stdlib path streams chunks via json.dump, the orjson path
+        writes its UTF-8 buffer without the str round-trip.
+
+        Args:
+            data: Data to convert to JSON
+            fp: Binary file object to write to
+        """
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if self.pretty else 0
+            fp.write(
+                orjson.dumps(data, default=self._json_serialize, option=option)
+            )
+            return
+
+        text_fp = io.TextIOWrapper(fp, encoding="utf-8", write_through=True)
+        try:
+            json.dump(
+                data,
+                text_fp,
+                indent=2 if self.pretty else None,
+                ensure_ascii=False,
+                default=self._json_serialize,
+            )
+        finally:
+            # Detach so closing the wrapper doesn't close the caller's fp
+            text_fp.detach()
+
     def _json_serialize(self, obj: Any) -> Any:
         """Custom JSON serializer for handling non-serializable objects.
         
@@ -239,27 +542,83 @@ class JsonFormatter:
         """
         if not isinstance(data, dict):
             return {}
-            
-        result = {}
-        for k, v in data.items():
-            if isinstance(v, dict):
-                result[k] = self._sanitize_for_json(v)
-            elif isinstance(v, (str, int, float, bool, type(None))):
-                result[k] = v
-            elif isinstance(v, list):
-                result[k] = [
-                    self._sanitize_for_json(i) if isinstance(i, dict) else str(i)
-                    for i in v
-                ]
-            else:
-                # Convert anything else to string
-                result[k] = str(v)
+
+        result: Dict[str, Any] = {}
+        # Explicit work stack instead of recursion: no per-level Python
+        # frames, and deep payloads can't hit the recursion limit
+        stack = [(data, result)]
+        while stack:
+            src, dst = stack.pop()
+            for k, v in src.items():
+                if type(v) in _JSON_PRIM_SET:
+                    dst[k] = v
+                elif isinstance(v, dict):
+                    child: Dict[str, Any] = {}
+                    dst[k] = child
+                    stack.append((v, child))
+                elif isinstance(v, list):
+                    items = []
+                    for i in v:
+                        if isinstance(i, dict):
+                            nested: Dict[str, Any] = {}
+                            items.append(nested)
+                            stack.append((i, nested))
+                        else:
+                            items.append(str(i))
+                    dst[k] = items
+                elif isinstance(v, (str, int, float)):
+                    # Primitive subclasses (enums, bool) miss the exact
+                    # type fast path but are still JSON-safe
+                    dst[k] = v
+                else:
+                    # Convert anything else to string
+                    dst[k] = str(v)
         return result
 
 
+@lru_cache(maxsize=16)
+def _get_markdown_formatter(kwargs_items: tuple) -> MarkdownFormatter:
+    """Return a MarkdownFormatter memoized per option set.
+
+    Formatters hold no per-convert state, so one instance per kwargs
+    combination serves every format_content call with those options.
+    """
+    return MarkdownFormatter(**dict(kwargs_items))
+
+
+@lru_cache(maxsize=16)
+def _get_text_formatter(kwargs_items: tuple) -> TextFormatter:
+    """Return a TextFormatter memoized per option set."""
+    return TextFormatter(**dict(kwargs_items))
+
+
+def _format_markdown(html: str, **kwargs) -> str:
+    """Format HTML as Markdown."""
+    return _get_markdown_formatter(tuple(sorted(kwargs.items()))).convert(html)
+
+
+def _format_text(html: str, **kwargs) -> str:
+    """Format HTML as plain text."""
+    return _get_text_formatter(tuple(sorted(kwargs.items()))).convert(html)
+
+
+def _format_html(html: str, **kwargs) -> str:
+    """Return sanitized HTML."""
+    return _cached_html_clean(html)
+
+
+# Per-format handlers, looked up in one dict probe per call instead of
+# walking an if/elif chain
+_DISPATCH: Dict[OutputFormat, Callable[..., str]] = {
+    OutputFormat.MARKDOWN: _format_markdown,
+    OutputFormat.TEXT: _format_text,
+    OutputFormat.HTML: _format_html,
+}
+
+
 def format_content(
-    html: str, 
-    format_type: Union[OutputFormat, str], 
+    html: str,
+    format_type: Union[OutputFormat, str],
     **kwargs
 ) -> str:
     """Format HTML content to the specified output format.
@@ -276,39 +635,24 @@ def format_content(
         ValueError: If an unsupported format is specified
     """
     if isinstance(format_type, str):
-        try:
-            format_type = OutputFormat(format_type.lower())
-        except ValueError:
+        coerced = _FORMAT_BY_STR.get(format_type.lower())
+        if coerced is None:
             raise ValueError(
                 f"Unsupported format: {format_type}. "
-                f"Use one of {', '.join([f.value for f in OutputFormat])}"
+                f"Use one of {_FORMAT_NAMES}"
             )
+        format_type = coerced
     
-    logger.debug(f"Formatting content to {format_type.value}")
-    
-    if format_type == OutputFormat.MARKDOWN:
-        formatter = MarkdownFormatter(**kwargs)
-        return formatter.convert(html)
-    elif format_type == OutputFormat.TEXT:
-        formatter = TextFormatter(**kwargs)
-        return formatter.convert(html)
-    elif format_type == OutputFormat.HTML:
-        # Just return sanitized HTML
-        return bleach.clean(
-            html,
-            tags=bleach.sanitizer.ALLOWED_TAGS + [
-                'div', 'span', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-                'table', 'thead', 'tbody', 'tr', 'th', 'td',
-                'ul', 'ol', 'li', 'dl', 'dt', 'dd',
-                'img', 'figure', 'figcaption', 'main', 'article',
-                'section', 'aside', 'details', 'summary'
-            ],
-            attributes={
-                **bleach.sanitizer.ALLOWED_ATTRIBUTES,
-                'img': ['src', 'alt', 'title', 'width', 'height'],
-                'a': ['href', 'title', 'rel'],
-                '*': ['class', 'id'],
-            },
-        )
-    else:
+    try:
+        handler = _DISPATCH[format_type]
+    except KeyError:
         raise ValueError(f"Formatting for {format_type} not implemented")
+
+    # Empty and whitespace-only inputs format to nothing; skip the
+    # formatter construction and HTML parse entirely
+    if not html or html.isspace():
+        return ""
+
+    logger.debug("Formatting content to %s", format_type.value)
+
+    return handler(html, **kwargs)
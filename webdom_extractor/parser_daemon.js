@@ -0,0 +1,32 @@
+#!/usr/bin/env node
+
+// Long-lived Postlight Parser daemon.
+//
+// Reads one request per line on stdin and writes the parse result as a
+// single JSON line on stdout, so a batch of N requests pays Node startup
+// cost once instead of N times. A request is either a bare URL, or a JSON
+// object {"url": ..., "html": ...} to parse pre-fetched HTML without a
+// tempfile round-trip. Errors are reported in-band as {"error": true, ...}
+// lines to keep the request/response stream aligned.
+
+const Parser = require("@postlight/parser");
+const readline = require("readline");
+
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+rl.on("line", async (line) => {
+  try {
+    let result;
+    if (line.startsWith("{")) {
+      const request = JSON.parse(line);
+      result = await Parser.parse(request.url, { html: request.html });
+    } else {
+      result = await Parser.parse(line);
+    }
+    process.stdout.write(JSON.stringify(result) + "\n");
+  } catch (err) {
+    process.stdout.write(
+      JSON.stringify({ error: true, message: String(err) }) + "\n"
+    );
+  }
+});